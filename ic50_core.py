@@ -0,0 +1,469 @@
+import math
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+from numba import njit
+
+# plotly and scipy are imported lazily inside the calculation paths:
+# a cold start that only renders the form skips their import cost.
+
+# =========================
+# CUSTOM CSS
+# =========================
+CSS = """
+<style>
+.main {
+    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+}
+h1 {
+    color: #1e3a8a;
+    font-weight: 700;
+}
+.metric-box {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 1.5rem;
+    border-radius: 12px;
+    color: white;
+    text-align: center;
+    margin: 1rem 0;
+}
+.metric-value {
+    font-size: 2.2rem;
+    font-weight: 700;
+}
+.metric-label {
+    text-transform: uppercase;
+    font-size: 0.9rem;
+    opacity: 0.9;
+}
+.stButton>button {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    color: white;
+    border-radius: 8px;
+    font-weight: 600;
+}
+</style>
+"""
+
+@st.cache_resource
+def _inject_css():
+    # Static elements in cached functions are replayed by Streamlit, so
+    # the markdown call itself runs once per server process.
+    st.markdown(CSS, unsafe_allow_html=True)
+    return True
+
+# =========================
+# LANGUAGE DICTIONARY
+# =========================
+@st.cache_resource
+def _langs():
+    # Built once per server process; reruns get the cached dict instead
+    # of re-evaluating ~50 string allocations.
+    return {
+        "tr": {
+            "title": "🧬 IC₅₀ Hesaplayıcı",
+            "subtitle": "4-Parametreli Lojistik Regresyon (4PL)",
+            "compound": "🔬 Madde adı",
+            "settings": "⚙️ Deney Ayarları",
+            "rep": "Tekrar sayısı",
+            "conc": "Konsantrasyon sayısı",
+            "unit": "Birim",
+            "control": "🎯 Kontrol absorbansları",
+            "table": "📊 Absorbans Tablosu",
+            "calc": "🧮 IC₅₀ HESAPLA",
+            "success": "Hesaplama başarılı",
+            "error": "Hesaplama yapılamadı. Verileri kontrol edin.",
+            "control_error": "Kontrol absorbansları sıfır olamaz.",
+            "xlab": "Konsantrasyon ({unit})",
+            "ylab": "Normalize yanıt (%)",
+            "data": "Veri",
+            "fit": "4PL uyum",
+            "ic50": "IC₅₀ Değeri",
+            "download_png": "PNG indir",
+            "download_pdf": "PDF indir",
+            "batch": "📥 Toplu analiz (CSV)",
+            "batch_help": "İlk sütun: konsantrasyon. Diğer sütunlar: bileşik başına normalize yanıt (%).",
+            "author": "Turgut Şekerler"
+        },
+        "en": {
+            "title": "🧬 IC₅₀ Calculator",
+            "subtitle": "4-Parameter Logistic Regression (4PL)",
+            "compound": "🔬 Compound name",
+            "settings": "⚙️ Experiment Settings",
+            "rep": "Replicates",
+            "conc": "Concentrations",
+            "unit": "Unit",
+            "control": "🎯 Control absorbance",
+            "table": "📊 Absorbance Table",
+            "calc": "🧮 CALCULATE IC₅₀",
+            "success": "Calculation successful",
+            "error": "Calculation failed. Check your data.",
+            "control_error": "Control absorbance cannot be zero.",
+            "xlab": "Concentration ({unit})",
+            "ylab": "Normalized response (%)",
+            "data": "Data",
+            "fit": "4PL fit",
+            "ic50": "IC₅₀ Value",
+            "download_png": "Download PNG",
+            "download_pdf": "Download PDF",
+            "batch": "📥 Batch analysis (CSV)",
+            "batch_help": "First column: concentration. Remaining columns: normalized response (%) per compound.",
+            "author": "Turgut Sekerler"
+        }
+    }
+
+# =========================
+# 4PL MODEL
+# =========================
+@njit(cache=True, fastmath=True)
+def _sigma(z):
+    # Stable 1/(1 + exp(z)): never overflows for extreme trial steps, so
+    # the solver sees finite residuals instead of nan and wasted steps.
+    if z > 0.0:
+        e = np.exp(-z)
+        return e / (1.0 + e)
+    return 1.0 / (1.0 + np.exp(z))
+
+@njit(cache=True, fastmath=True)
+def four_pl(x, bottom, top, ic50, hill):
+    # Log-domain form of bottom + (top-bottom)/(1 + (x/ic50)**hill).
+    span = top - bottom
+    out = np.empty_like(x)
+    for i in range(x.size):
+        out[i] = bottom + span * _sigma(hill * np.log(x[i] / ic50))
+    return out
+
+@njit(cache=True, fastmath=True)
+def four_pl_resid(p, log_x, y):
+    # Takes log-concentrations so the per-point log is hoisted out of the
+    # solver loop; only log(ic50) is recomputed per trial step.
+    bottom, top, ic50, hill = p
+    span = top - bottom
+    log_ic50 = np.log(ic50)
+    out = np.empty_like(log_x)
+    for i in range(log_x.size):
+        out[i] = bottom + span * _sigma(hill * (log_x[i] - log_ic50)) - y[i]
+    return out
+
+@njit(cache=True, fastmath=True)
+def four_pl_jac(p, log_x, y):
+    """Analytic Jacobian of the 4PL residual (N x 4).
+
+    Saves the 4 extra residual evaluations per LM step that the
+    finite-difference Jacobian would cost. With s = 1/(1 + (x/ic50)**hill),
+    every partial is a cheap function of s*(1-s).
+    """
+    bottom, top, ic50, hill = p
+    span = top - bottom
+    log_ic50 = np.log(ic50)
+    J = np.empty((log_x.size, 4))
+    for i in range(log_x.size):
+        lr = log_x[i] - log_ic50
+        s = _sigma(hill * lr)
+        w = s * (1.0 - s)
+        J[i, 0] = 1.0 - s
+        J[i, 1] = s
+        J[i, 2] = span * w * hill / ic50
+        J[i, 3] = -span * w * lr
+    return J
+
+# Unit grid for the fitted curve: rescaling via cmin * (cmax/cmin)**t
+# replaces a fresh np.logspace (two log10 calls + allocation) per run.
+# 128 log-spaced samples are visually indistinguishable from 400 on a
+# 500 px canvas.
+_XGRID = np.linspace(0.0, 1.0, 128)
+
+# Warm the Numba cache at import so the first click doesn't pay compilation.
+_p0_warm = np.array([0.0, 100.0, 1.0, 1.0])
+_xy_warm = np.array([0.0]), np.array([50.0])
+four_pl(np.array([1.0]), 0.0, 100.0, 1.0, 1.0)
+four_pl_resid(_p0_warm, *_xy_warm)
+four_pl_jac(_p0_warm, *_xy_warm)
+
+def _solve_4pl(concs, response):
+    from scipy.optimize import least_squares
+
+    # log(concs) once per fit instead of once per solver evaluation.
+    # A 0-dose/vehicle row gives log(0) = -inf, which would poison the
+    # Jacobian with 0 * -inf = nan and crash the dogbox subproblem; the
+    # 4PL sits exactly on the top plateau long before exp underflow, so
+    # floor the log at a finite value instead.
+    with np.errstate(divide="ignore"):
+        log_concs = np.maximum(np.log(concs), -700.0)
+
+    # Seed ic50 where the response crosses 50% (log-linear interpolation
+    # between the bracketing points); a poor seed costs the solver several
+    # extra iterations. Falls back to the median when nothing crosses.
+    ic50_seed = np.median(concs)
+    below = np.nonzero(response < 50.0)[0]
+    if below.size and below[0] > 0:
+        i = below[0]
+        lo, hi = response[i - 1], response[i]
+        if lo != hi:
+            frac = (50.0 - lo) / (hi - lo)
+            ic50_seed = np.exp(log_concs[i - 1]
+                               + (log_concs[i] - log_concs[i - 1]) * frac)
+
+    # ndarray reductions, not Python min()/max() (which iterate and box
+    # element by element).
+    p0 = [0, 100, ic50_seed, 1.0]
+    bounds = ([0, 80, 0, 0.1], [20, 120, concs.max() * 10, 5])
+
+    # Dogbox solves the bounded trust-region subproblem in closed form;
+    # 200 evaluations is ample for a 4-parameter fit on <=12 points and
+    # caps pathological runs on mistyped data.
+    # errstate keeps Python's warning machinery out of the iteration loop
+    # when trial steps overflow the power term.
+    with np.errstate(over="ignore", invalid="ignore"):
+        return least_squares(
+            four_pl_resid, p0, jac=four_pl_jac,
+            bounds=bounds, args=(log_concs, response),
+            method="dogbox", xtol=1e-10, ftol=1e-10, max_nfev=200
+        )
+
+@st.cache_data(show_spinner=False)
+def _fit_ic50(concs, abs_vals, control_mean):
+    """Run the 4PL fit once per distinct (table, control) input.
+
+    Cached so Streamlit reruns (language toggle, unit change, ...) with
+    unchanged data skip the curve_fit call entirely.
+    """
+    concs = np.ascontiguousarray(concs, dtype=np.float64)
+    abs_vals = np.ascontiguousarray(abs_vals, dtype=np.float64)
+
+    # One reduction pass: mean over replicates, control division and the
+    # percent scaling collapse into a single scalar factor.
+    n_rep = abs_vals.shape[1]
+    response = abs_vals.sum(axis=1)
+    response *= 100.0 / (control_mean * n_rep)
+
+    res = _solve_4pl(concs, response)
+    popt = res.x
+
+    # Covariance from J^T J, same as curve_fit does internally.
+    dof = max(response.size - popt.size, 1)
+    s_sq = 2 * res.cost / dof
+    pcov = np.linalg.pinv(res.jac.T @ res.jac) * s_sq
+    return popt, pcov, response
+
+@st.cache_data(show_spinner=False)
+def _fit_ic50_batch(concs, responses):
+    """Fit one 4PL per row of normalized responses (n_compounds x n_conc).
+
+    The compiled residual/Jacobian pair is shared across compounds, so a
+    whole plate is a tight loop over the same solver used for single fits.
+    """
+    concs = np.ascontiguousarray(concs, dtype=np.float64)
+    responses = np.ascontiguousarray(responses, dtype=np.float64)
+    popts = np.empty((responses.shape[0], 4))
+    for k in range(responses.shape[0]):
+        popts[k] = _solve_4pl(concs, responses[k]).x
+    return popts
+
+@st.cache_data(show_spinner=False)
+def _curve(cmin, cmax, popt_bytes):
+    """Sample the fitted curve on the padded log grid, once per fit."""
+    popt = np.frombuffer(popt_bytes)
+    xmin, xmax = cmin / 2, cmax * 2
+    xfit = xmin * np.power(xmax / xmin, _XGRID)
+    return xfit, four_pl(xfit, *popt)
+
+@st.cache_data(show_spinner=False)
+def _empty_table(nconc, reps):
+    # Dict-of-arrays construction: pandas adopts each float64 column
+    # as-is instead of allocating one 2-D block and re-splitting it.
+    # st.data_editor copies its input, so handing out the cached frame
+    # (itself copied per cache_data call) is safe.
+    cols = {"Concentration": np.zeros(nconc)}
+    cols.update({f"Rep {i+1}": np.zeros(nconc) for i in range(reps)})
+    return pd.DataFrame(cols, copy=False)
+
+@st.cache_data(show_spinner=False)
+def _render_download(fmt, popt_bytes, concs_bytes, response_bytes,
+                     cmin, cmax, xlabel, ylabel, title):
+    """Render the download figure once per distinct fit.
+
+    One Plotly figure description serialized via Kaleido, so the export
+    matches the on-screen chart and no second plotting library is drawn.
+    """
+    import plotly.graph_objects as go
+
+    popt = np.frombuffer(popt_bytes)
+    concs = np.frombuffer(concs_bytes)
+    response = np.frombuffer(response_bytes)
+
+    xmin, xmax = cmin / 2, cmax * 2
+    xfit, yfit = _curve(cmin, cmax, popt_bytes)
+
+    fig = go.Figure()
+    fig.add_scatter(x=concs, y=response, mode="markers")
+    fig.add_scatter(x=xfit, y=yfit, mode="lines")
+    fig.add_vline(x=popt[2], line_dash="dash", annotation_text="IC₅₀")
+    fig.update_xaxes(type="log", range=[np.log10(xmin), np.log10(xmax)],
+                     title=xlabel)
+    fig.update_yaxes(title=ylabel, range=[0, 110])
+    fig.update_layout(title=title, showlegend=False)
+
+    if fmt == "png":
+        return fig.to_image(format="png", width=1600, height=1000, scale=2)
+    return fig.to_image(format="pdf", width=1600, height=1000)
+
+# =========================
+# APP
+# =========================
+def run_app():
+    st.set_page_config(
+        page_title="IC50 Calculator",
+        page_icon="🧬",
+        layout="centered"
+    )
+    _inject_css()
+
+    language = st.selectbox("🌍 Language / Dil", ["Türkçe", "English"])
+    lang = "tr" if language == "Türkçe" else "en"
+    T = _langs()[lang]
+
+    # ===== HEADER =====
+    st.markdown(f"# {T['title']}")
+    st.caption(T["subtitle"])
+    st.caption(T["author"])
+
+    compound_name = st.text_input(T["compound"])
+
+    # ===== SETTINGS =====
+    st.markdown(f"### {T['settings']}")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        reps = st.number_input(T["rep"], 2, 8, 3)
+    with c2:
+        nconc = st.number_input(T["conc"], 2, 12, 3)
+    with c3:
+        unit = st.selectbox(T["unit"], ["nM", "µM", "mg/mL", "µg/mL"])
+
+    # ===== CONTROL + TABLE (form: cell edits rerun nothing until submit) =====
+    with st.form("ic50_form"):
+        st.markdown(f"### {T['control']}")
+        control_vals = []
+        for i, col in enumerate(st.columns(reps)):
+            control_vals.append(col.number_input(f"{i+1}", value=0.0, format="%.4f"))
+
+        st.markdown(f"### {T['table']}")
+        edited = st.data_editor(_empty_table(nconc, reps),
+                                use_container_width=True, hide_index=True)
+
+        submitted = st.form_submit_button(T["calc"], use_container_width=True)
+
+    # ===== CALCULATION =====
+    if submitted:
+        try:
+            import plotly.graph_objects as go
+
+            # The editor is seeded from float64 zeros, so one C-level cast
+            # replaces the per-column apply/dropna round trip.
+            arr = edited.to_numpy(dtype=np.float64, copy=False)
+            arr = arr[~np.isnan(arr).any(axis=1)]
+            concs = arr[:, 0]
+            abs_vals = arr[:, 1:]
+
+            # fsum on the small Python list skips ndarray construction.
+            control_mean = math.fsum(control_vals) / len(control_vals)
+
+            # All-zero controls (the default state) would make the response
+            # inf/nan and send the solver through its full iteration budget.
+            if not math.isfinite(control_mean) or control_mean == 0:
+                st.error(T["control_error"])
+                st.stop()
+            popt, _, response = _fit_ic50(concs, abs_vals, control_mean)
+
+            ic50 = popt[2]
+            st.success(T["success"])
+
+            st.markdown(f"""
+            <div class="metric-box">
+                <div class="metric-label">{T['ic50']}</div>
+                <div class="metric-value">{ic50:.4g} {unit}</div>
+                <div class="metric-label">{compound_name or "—"}</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+            # ===== SHARED AXIS =====
+            # 0-dose rows can't sit on the log axis; pad the range from
+            # the smallest positive concentration.
+            cmin, cmax = concs[concs > 0].min(), concs.max()
+            xmin, xmax = cmin / 2, cmax * 2
+            xfit, yfit = _curve(cmin, cmax, popt.tobytes())
+
+            # ===== PLOTLY =====
+            fig = go.Figure()
+            fig.add_scatter(x=concs, y=response, mode="markers", name=T["data"])
+            fig.add_scatter(x=xfit, y=yfit, mode="lines", name=T["fit"])
+            fig.add_vline(x=ic50, line_dash="dash", annotation_text="IC₅₀")
+
+            fig.update_xaxes(
+                type="log",
+                range=[np.log10(xmin), np.log10(xmax)],
+                title=T["xlab"].format(unit=unit)
+            )
+            fig.update_yaxes(title=T["ylab"], range=[0, 110])
+            fig.update_layout(height=500)
+
+            st.plotly_chart(fig, use_container_width=True)
+
+            # ===== DOWNLOADS (cached per fit) =====
+            render_key = (popt.tobytes(), concs.tobytes(), response.tobytes(),
+                          cmin, cmax, T["xlab"].format(unit=unit), T["ylab"],
+                          compound_name or "IC50 curve")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.download_button(T["download_png"], _render_download("png", *render_key),
+                                   "IC50.png", "image/png")
+            with col2:
+                st.download_button(T["download_pdf"], _render_download("pdf", *render_key),
+                                   "IC50.pdf", "application/pdf")
+
+        except (RuntimeError, ValueError, np.linalg.LinAlgError) as e:
+            st.error(T["error"])
+            st.write(str(e))
+
+    # ===== BATCH (CSV) =====
+    st.markdown(f"### {T['batch']}")
+    st.caption(T["batch_help"])
+    batch_file = st.file_uploader("CSV", type="csv", label_visibility="collapsed")
+
+    if batch_file is not None:
+        try:
+            import plotly.graph_objects as go
+
+            batch_df = pd.read_csv(batch_file)
+            batch_arr = batch_df.to_numpy(dtype=np.float64, copy=False)
+            batch_arr = batch_arr[~np.isnan(batch_arr).any(axis=1)]
+            batch_concs = batch_arr[:, 0]
+            responses = batch_arr[:, 1:].T
+
+            popts = _fit_ic50_batch(batch_concs, responses)
+            names = list(batch_df.columns[1:])
+
+            st.dataframe(
+                pd.DataFrame({
+                    T["compound"]: names,
+                    f"{T['ic50']} ({unit})": popts[:, 2]
+                }),
+                use_container_width=True, hide_index=True
+            )
+
+            bmin = batch_concs[batch_concs > 0].min() / 2
+            bmax = batch_concs.max() * 2
+            xfit_b = bmin * np.power(bmax / bmin, _XGRID)
+            fig_b = go.Figure()
+            for name, p in zip(names, popts):
+                fig_b.add_scatter(x=xfit_b, y=four_pl(xfit_b, *p),
+                                  mode="lines", name=name)
+            fig_b.update_xaxes(type="log", title=T["xlab"].format(unit=unit))
+            fig_b.update_yaxes(title=T["ylab"], range=[0, 110])
+            fig_b.update_layout(height=500)
+            st.plotly_chart(fig_b, use_container_width=True)
+
+        except (RuntimeError, ValueError, np.linalg.LinAlgError) as e:
+            st.error(T["error"])
+            st.write(str(e))